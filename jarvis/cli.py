@@ -7,6 +7,7 @@ Features
 --------
 * Multi‑line prompt entry (paste blocks, hit *blank line* or `/send` to submit)
 * `/new` command resets conversation history
+* `/scancode <path>` snapshots a Python codebase in the background
 * Coloured inline prefix “🤖 Jarvis ‑”
 * Streaming answers with Markdown rendering
 * Ctrl‑C while **typing**  → draft cleared (stay in prompt)
@@ -16,28 +17,83 @@ Features
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import io
+import signal
 import sys
-from contextlib import suppress
+import threading
+import time
 import click
-from typing import Iterator, List
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncGenerator, AsyncIterator, List, Optional
 
-from rich.console import Console, Group
-from rich.live import Live
-from rich.markdown import Markdown
-from rich.text import Text
+if TYPE_CHECKING:                           # rich is imported lazily (cold start)
+    from prompt_toolkit import PromptSession
+    from rich.console import Console
+    from rich.text import Text
+
+    from .client import JarvisClient
 
 # ---------------------------------------------------------------------------
 
-console = Console()
-PREFIX_TEXT = Text("🤖 Jarvis - ", style="bold cyan")
+#: Repaint rate bounds (frames / s); the actual rate follows chunk arrival
+REFRESH_MIN_FPS: float = 2
+REFRESH_MAX_FPS: float = 12
+#: Repaints run on the event loop: wait ≥ this × the last paint's duration
+#: between them so rendering never takes more than a fraction of loop time
+PAINT_COST_FACTOR: float = 4
+REFRESH_START_FPS: float = 4
+#: Window over which the chunk arrival rate is measured, and its EMA weight
+RATE_WINDOW_SEC: float = 0.5
+RATE_EMA_ALPHA: float = 0.2
+#: Upper bound on how long the stream loop waits before re-checking state
+POLL_SEC: float = 0.05
+#: Lines that submit the current draft (compared stripped, case‑insensitive)
+_SENTINELS = frozenset({"/send", "/new"})
+#: Longest raw line still treated as a sentinel candidate (allows stray spaces)
+_SENTINEL_MAX_LEN: int = max(map(len, _SENTINELS)) + 8
+
+
+@functools.lru_cache(maxsize=None)
+def _console() -> Console:
+    """Shared ``rich`` console, created (and ``rich`` imported) on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=None)
+def _session() -> PromptSession:
+    """
+    Single ``prompt_toolkit`` session reused for every line (keeps history).
+
+    Unlike ``input()`` it reads keys from its own event loop, so Ctrl‑C is
+    reported immediately as ``KeyboardInterrupt`` on every platform,
+    including Windows consoles.
+    """
+    from prompt_toolkit import PromptSession
+
+    return PromptSession()
+
+
+@functools.lru_cache(maxsize=None)
+def _prefix_text() -> Text:
+    """Persistent coloured prefix shown in front of every answer."""
+    from rich.text import Text
+
+    return Text("🤖 Jarvis - ", style="bold cyan")
 
 
 # ──────────────────────────────────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────────────────────────────────
-def _read_multiline_question() -> str:
+async def _read_multiline_question() -> str:
     """
-    Read a prompt of arbitrary length from ``stdin`` **synchronously**.
+    Read a prompt of arbitrary length from the terminal (``prompt_toolkit``).
+
+    Lines are awaited with ``prompt_async`` so other tasks on the event loop
+    (e.g. a background ``/scancode``) keep running while the user types.
 
     Terminators
     -----------
@@ -54,7 +110,7 @@ def _read_multiline_question() -> str:
     Time   O(N)  where *N* = input characters
     Memory O(N)
     """
-    console.print(
+    _console().print(
         "[bold magenta]You[/] "
         "(multi‑line allowed; end with blank line, /send or /new; Ctrl‑D to quit)"
         "Ask questions about python codebase using `/scancode <path>`"
@@ -63,20 +119,31 @@ def _read_multiline_question() -> str:
     lines: List[str] = []
     while True:
         try:
-            line = input()
+            line = await _session().prompt_async("")
         except KeyboardInterrupt:           # Ctrl‑C while typing
-            console.print("[red]⏹️  Draft cleared (Ctrl‑C)[/]\n")
+            _console().print("[red]⏹️  Draft cleared (Ctrl‑C)[/]\n")
             return ""
         except EOFError:                    # Ctrl‑D / Ctrl‑Z+Enter
-            console.print("\nGood‑bye 👋", style="cyan")
+            _console().print("\nGood‑bye 👋", style="cyan")
             raise SystemExit(0)
 
-        sentinel = line.strip().lower()
-        if sentinel in {"/send", "/new"} or (line == "" and lines):
-            lines.append(line)              # keep sentinel/blank for caller
+        if line == "":
+            if lines:                       # blank after text → submit
+                lines.append(line)
+                break
+            continue                        # stray blank at start
+
+        # sentinels are short and start with "/" (maybe after blanks): skip
+        # strip()/lower() for every other line.  ``line[0]`` is a cached
+        # one‑char string, so the first test allocates nothing.
+        head = line[0]
+        if (
+            (head == "/" or head.isspace())
+            and len(line) <= _SENTINEL_MAX_LEN
+            and line.strip().lower() in _SENTINELS
+        ):
+            lines.append(line)              # keep sentinel for caller
             break
-        if line == "" and not lines:        # stray blank at start
-            continue
 
         lines.append(line)
 
@@ -86,27 +153,151 @@ def _read_multiline_question() -> str:
 # ──────────────────────────────────────────────────────────────────────────
 # Streaming renderer
 # ──────────────────────────────────────────────────────────────────────────
-def _render_response(stream: Iterator[str]) -> None:
+async def _poll_chunks(
+    stream: AsyncIterator[str], interval: float = POLL_SEC
+) -> AsyncGenerator[Optional[str], None]:
+    """
+    Re-yield *stream* but never block longer than *interval* seconds.
+
+    ``None`` is yielded whenever no chunk arrived within *interval*, so the
+    caller keeps control during model stalls instead of sitting inside one
+    long socket read.  The pending read is *not* cancelled on timeout.
+    """
+    it = stream.__aiter__()
+    nxt = asyncio.ensure_future(it.__anext__())
+    try:
+        while True:
+            done, _ = await asyncio.wait({nxt}, timeout=interval)
+            if not done:
+                yield None
+                continue
+            try:
+                chunk = nxt.result()
+            except StopAsyncIteration:
+                return
+            yield chunk
+            nxt = asyncio.ensure_future(it.__anext__())
+    finally:
+        nxt.cancel()
+        await asyncio.wait({nxt})           # let the cancelled read unwind
+
+
+class _RefreshPacer:
+    """
+    Decide when to repaint, adapting the cadence to the token arrival rate.
+
+    Every ``RATE_WINDOW_SEC`` the chunk rate is folded into an EMA and the
+    repaint interval becomes ``1 / rate`` clamped to
+    [``REFRESH_MIN_FPS``, ``REFRESH_MAX_FPS``]: bursts repaint quickly,
+    slow models are not redrawn for nothing.  Nothing is repainted while
+    no new text is pending.
+
+    Painting is synchronous on the event loop, so the interval is also kept
+    at ``PAINT_COST_FACTOR`` times the last measured paint duration: long
+    answers repaint less often instead of starving the cancel/poll loop.
+    """
+
+    def __init__(self, now: float) -> None:
+        self._rate = REFRESH_START_FPS
+        self._interval = 1 / REFRESH_START_FPS
+        self._window_start = now
+        self._window_chunks = 0
+        self._last_paint = 0.0
+        self._paint_cost = 0.0
+        self.pending = False
+
+    def feed(self, now: float, got_chunk: bool) -> bool:
+        """Account for one poll tick; return *True* if a repaint is due."""
+        if got_chunk:
+            self._window_chunks += 1
+            self.pending = True
+
+        elapsed = now - self._window_start
+        if elapsed >= RATE_WINDOW_SEC:
+            observed = self._window_chunks / elapsed
+            self._rate += RATE_EMA_ALPHA * (observed - self._rate)
+            fps = max(REFRESH_MIN_FPS, min(REFRESH_MAX_FPS, self._rate))
+            self._interval = 1 / fps
+            self._window_start = now
+            self._window_chunks = 0
+
+        interval = max(self._interval, PAINT_COST_FACTOR * self._paint_cost)
+        if self.pending and now - self._last_paint >= interval:
+            self._last_paint = now
+            self.pending = False
+            return True
+        return False
+
+    def painted(self, duration: float) -> None:
+        """Record how long the repaint granted by :meth:`feed` took."""
+        self._paint_cost = duration
+
+
+async def _stream_response(stream: AsyncIterator[str], cancel: threading.Event) -> None:
     """
     Stream tokens from *stream* while showing a **persistent** coloured prefix.
 
-    Time   O(L)  L = number of tokens received
-    Memory O(A)  A = size of final answer
+    *cancel* is checked at least every ``POLL_SEC``; once set, streaming stops.
+
+    Chunks are coalesced and repainted only when :class:`_RefreshPacer` says
+    so (Live's fixed-rate refresh thread is disabled).  While streaming the
+    answer is shown as plain ``Text``; rich's Markdown is expensive to
+    *render* (token walk + pygments per code block), so it is built and
+    painted exactly once, when the stream ends.
+
+    Time   O(L + R·A)  L = tokens received, R = repaints (≤ 12 / s)
+    Memory O(A)        A = size of final answer
     """
-    answer: List[str] = []
-    with Live("", console=console, refresh_per_second=8) as live:
+    # Markdown pulls in markdown-it + pygments: defer until the first answer
+    from rich.console import Group
+    from rich.live import Live
+    from rich.markdown import Markdown
+    from rich.text import Text
+
+    prefix = _prefix_text()
+    buf = io.StringIO()
+    chunks = _poll_chunks(stream)
+    with Live("", console=_console(), auto_refresh=False) as live:
+        pacer = _RefreshPacer(time.monotonic())
         try:
-            for chunk in stream:
-                answer.append(chunk)
-                live.update(Group(PREFIX_TEXT, Markdown("".join(answer))))
-        except KeyboardInterrupt:           # Ctrl‑C cancels completion
-            live.stop()
-            console.print("\n[red]⏹️  Completion cancelled (Ctrl‑C)[/]")
-            with suppress(Exception):
-                for _ in stream:            # drain generator to close socket
-                    pass
+            async for chunk in chunks:
+                if cancel.is_set():
+                    break
+                if chunk is not None:
+                    buf.write(chunk)
+                if pacer.feed(time.monotonic(), chunk is not None):
+                    start = time.monotonic()
+                    live.update(Group(prefix, Text(buf.getvalue())), refresh=True)
+                    pacer.painted(time.monotonic() - start)
+        finally:
+            await chunks.aclose()           # stop the in-flight read now
+        # final render with full formatting (code fences, headings, …)
+        live.update(Group(prefix, Markdown(buf.getvalue())), refresh=True)
 
-    console.print()                         # tidy newline after answer
+
+async def _render_response(client: JarvisClient, question: str) -> None:
+    """
+    Stream the answer to *question* on the running event loop.
+
+    While streaming, SIGINT only sets a flag that the stream loop polls, so
+    Ctrl‑C never raises ``KeyboardInterrupt`` through the Ollama SDK.  On
+    cancel, :meth:`JarvisClient.cancel` closes the HTTP response at once
+    instead of draining tokens.  The previous handler is restored afterwards.
+    """
+    stream = client.ask(question)
+    cancel = threading.Event()
+    previous = signal.signal(signal.SIGINT, lambda signum, frame: cancel.set())
+    try:
+        await _stream_response(stream, cancel)
+    finally:
+        if cancel.is_set():
+            await client.cancel()
+        await stream.aclose()
+        signal.signal(signal.SIGINT, previous)
+
+    if cancel.is_set():                     # Ctrl‑C cancels completion
+        _console().print("\n[red]⏹️  Completion cancelled (Ctrl‑C)[/]")
+    _console().print()                      # tidy newline after answer
 
 
 # ──────────────────────────────────────────────────────────────────────────
@@ -128,35 +319,68 @@ def cli(model: str, context_window: int) -> None:
     """
     Jarvis CLI for chatting with a local Ollama model.
     """
-    console.print(
+    _console().print(
         f"[bold cyan]Jarvis Local CLI[/] — model: [magenta]{model}[/], context: [yellow]{context_window} tokens[/]\n"
         "Press Ctrl‑D to quit, Ctrl‑C to cancel\n"
     )
 
+    asyncio.run(_main_async(model, context_window))
+
+
+async def _await_scan(task: asyncio.Task[None]) -> None:
+    """
+    Wait for a background ``/scancode`` and report (not raise) its failure.
+
+    An error in the scan must not end the session while the user is busy
+    with an unrelated question.
+    """
+    try:
+        await task
+    except Exception as exc:                # e.g. PermissionError on a read
+        _console().print(f"[red]⚠️  Code scan failed: {exc}[/]\n")
+
+
+async def _main_async(model: str, context_window: int) -> None:
+    """
+    Chat loop: prompt, scan and answer on one event loop.
+
+    ``/scancode`` runs in the background while the user keeps typing; its
+    snapshot is awaited only when the next question (or ``/new``) needs it.
+    """
     from .client import JarvisClient
     client = JarvisClient(model=model, context_size = context_window)
+    scan_task: Optional[asyncio.Task[None]] = None
 
     while True:
-        question = _read_multiline_question()
+        question = await _read_multiline_question()
         if not question.strip():
             continue
 
         if question.strip().lower().startswith("/scancode"):
             parts = question.split(maxsplit=1)
-            client.scan_codebase(parts[1])
+            if scan_task is not None:       # keep snapshots in request order
+                await _await_scan(scan_task)
+            # status goes out on the loop thread, not from the scan worker,
+            # so it never lands in the middle of the live prompt
+            _console().print(f"Analysing codebase at : {Path(parts[1]).resolve()}")
+            scan_task = asyncio.create_task(client.scan_codebase(parts[1]))
             continue
 
+        if scan_task is not None:           # snapshot must be in the history
+            await _await_scan(scan_task)
+            scan_task = None
+
         if question.strip().lower().endswith("/new"):
             client.reset()
-            console.print("[cyan]🔄  New chat started.[/]\n")
+            _console().print("[cyan]🔄  New chat started.[/]\n")
             continue
 
-        _render_response(client.ask(question))
+        await _render_response(client, question)
 
 
 if __name__ == "__main__":
     try:
         cli()
     except KeyboardInterrupt:
-        console.print("\nGood‑bye 👋", style="cyan")
+        _console().print("\nGood‑bye 👋", style="cyan")
         sys.exit(0)
\ No newline at end of file
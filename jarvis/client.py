@@ -6,27 +6,36 @@ of the application never touches HTTP directly.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
-import time
+import random
 from pathlib import Path
-from typing import List, Dict, Iterator
+from typing import Any, AsyncGenerator, AsyncIterator, List, Dict, Optional
 
+import httpx
 import ollama                                # type: ignore[import]
-from requests.exceptions import ConnectionError, ReadTimeout
 
 from .scanner import CodeSnapshot
 
 LOGGER = logging.getLogger(__name__)
 MAX_RETRIES: int = 3
 BACKOFF_SEC: float = 1.5
+#: Conversation turns (user + assistant pairs) re‑sent with every request
+MAX_TURNS: int = 10
 
 
 class JarvisClient:
-    """Wrapper around ``ollama.chat`` with streaming support and retries."""
+    """Wrapper around ``ollama.AsyncClient.chat`` with streaming support and retries."""
 
     def __init__(self, model: str, context_size: int) -> None:
         self._model = model
         self.context_size = context_size
+        # one pooled client for the whole session: keeps the TCP connection
+        # alive between questions (callers must stay on a single event loop)
+        self._ollama = ollama.AsyncClient()
+        self._active_stream: Optional[AsyncIterator[Any]] = None
+        #: history message holding the latest snapshot of each scanned root
+        self._snapshots: Dict[Path, Dict[str, str]] = {}
         self._history: List[Dict[str, str]] = [
             {
                 "role": "system",
@@ -46,14 +55,22 @@ class JarvisClient:
 
         Time‑complexity : O(1)
         """
+        self._snapshots.clear()
         self._history = self._history[:1]          # keep index‑0 (system)
 
-    def ask(self, prompt: str) -> Iterator[str]:
+    async def ask(self, prompt: str) -> AsyncGenerator[str, None]:
         """
         Stream the assistant's response for a given *user* prompt.
 
+        The stream is asynchronous so callers can poll it with short timeouts
+        instead of blocking inside a socket read (keeps Ctrl‑C responsive).
+
+        Only the system messages and the last ``MAX_TURNS`` turns are sent.
+        A cancelled answer is kept as far as it streamed; if nothing arrived,
+        the prompt is dropped again so turns stay paired.
+
         Time‑complexity: **O(L)** where *L* is the number of streamed chunks.
-        Memory‑complexity: **O(H)** where *H* is history size.
+        Memory‑complexity: **O(H)** where *H* is (capped) history size.
 
         Raises
         ------
@@ -61,34 +78,109 @@ class JarvisClient:
             If the Ollama backend is unreachable after ``MAX_RETRIES``.
         """
         self._history.append({"role": "user", "content": prompt})
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                stream = ollama.chat(
-                    model=self._model,
-                    messages=self._history,
-                    stream=True,              # enables token streaming
-                    options={
-                        "num_ctx": self.context_size,
-                    }
-                )
-                for chunk in stream:
-                    yield chunk["message"]["content"]
-                # complete answer captured – append to history
-                self._history.append(
-                    {"role": "assistant", "content": self._history[-1]["content"]}
-                )
-                return
-            except (ConnectionError, ReadTimeout) as exc:
-                LOGGER.warning(
-                    "Ollama unavailable (attempt %d/%d): %s",
-                    attempt,
-                    MAX_RETRIES,
-                    exc,
-                )
-                time.sleep(BACKOFF_SEC * attempt)
-        raise RuntimeError("Could not reach the Ollama server after several attempts.")
-
-    def scan_codebase(self, root: str | Path = ".") -> None:
+        self._trim_history()
+        answered = False
+        reply_parts: List[str] = []
+        try:
+            for attempt in range(1, MAX_RETRIES + 1):
+                reply_parts = []
+                try:
+                    stream = await self._ollama.chat(
+                        model=self._model,
+                        messages=self._history,
+                        stream=True,          # enables token streaming
+                        options={
+                            "num_ctx": self.context_size,
+                        }
+                    )
+                    self._active_stream = stream
+                    try:
+                        async for chunk in stream:
+                            content = chunk["message"]["content"]
+                            reply_parts.append(content)
+                            yield content
+                    finally:
+                        await self.cancel()   # no‑op once fully consumed
+                    # complete answer captured – append to history
+                    self._history.append(
+                        {"role": "assistant", "content": "".join(reply_parts)}
+                    )
+                    answered = True
+                    return
+                except (ConnectionError, httpx.TransportError) as exc:
+                    if reply_parts:           # retrying would repeat output
+                        raise
+                    LOGGER.warning(
+                        "Ollama unavailable (attempt %d/%d): %s",
+                        attempt,
+                        MAX_RETRIES,
+                        exc,
+                    )
+                    # exponential backoff with full jitter: retries don't synchronise
+                    await asyncio.sleep(random.uniform(0, BACKOFF_SEC * 2 ** (attempt - 1)))
+            raise RuntimeError("Could not reach the Ollama server after several attempts.")
+        finally:
+            # cancelled or failed: keep strict user/assistant pairing
+            if not answered:
+                if reply_parts:               # what the user already saw
+                    self._history.append(
+                        {"role": "assistant", "content": "".join(reply_parts)}
+                    )
+                else:                         # nothing came back: drop prompt
+                    self._history.pop()
+
+    async def cancel(self) -> None:
+        """
+        Abort the answer currently being streamed, if any.
+
+        Closes the SDK stream – and with it the HTTP response – right away
+        instead of draining the tokens the server is still sending.
+        Must not be called while a read on that stream is in flight.
+
+        Time‑complexity : O(1)
+        """
+        stream, self._active_stream = self._active_stream, None
+        # ollama 0.4.8 returns an async generator from chat(stream=True);
+        # that is an implementation detail, so only close what can be closed
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def scan_codebase(self, root: str | Path = ".") -> None:
+        """
+        Add a snapshot of the codebase at *root* to the system context.
+
+        The (blocking, thread-pooled) scan runs in a worker thread so the
+        event loop stays free for prompting and streaming meanwhile.
+        """
         from .scanner import CodeScanner  # local import (soft dep)
-        code_context = CodeScanner(root).scan()
-        self._history.insert(1, {"role": "system", "content": str(code_context)})
\ No newline at end of file
+        key = Path(root).resolve()
+        code_context = await asyncio.to_thread(lambda: CodeScanner(key).scan())
+
+        # one snapshot per root: a re-scan replaces the previous message in
+        # place (a cache hit leaves it untouched) instead of stacking copies
+        previous = self._snapshots.get(key)
+        if previous is not None and any(m is previous for m in self._history):
+            previous["content"] = code_context
+            return
+        message = {"role": "system", "content": code_context}
+        self._snapshots[key] = message
+        self._history.insert(1, message)
+
+    # ---------- Internals --------------------------------------------------
+
+    def _trim_history(self) -> None:
+        """
+        Keep the leading system messages plus the last ``MAX_TURNS`` turns.
+
+        Time‑complexity : O(H)
+        """
+        head = 0
+        while head < len(self._history) and self._history[head]["role"] == "system":
+            head += 1
+        # runs right after a user message is appended: keep it plus the
+        # MAX_TURNS - 1 complete turns before it, so the window starts on a
+        # user message
+        keep = 2 * MAX_TURNS - 1
+        if len(self._history) - head > keep:
+            self._history = self._history[:head] + self._history[-keep:]
@@ -9,14 +9,21 @@ Time / Space complexity
 -----------------------
 * Scanning  : **O(F + S)** F = number of Python files, S = total size (bytes).
 * Snapshot  : **O(Snap)** Snap = characters retained (capped below).
+              Files are memory‑mapped; at most ``MAX_CHARS_PER_FILE`` bytes of
+              each are decoded.
+* Re‑scan   : **O(F)** stat calls only, while no file was added, removed or
+              modified (the previous snapshot is reused).
 """
 from __future__ import annotations
 
-import textwrap
+import io
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
 
-import pathspec  # pip install pathspec
+from pathspec import GitIgnoreSpec  # pip install 'pathspec>=0.10'
 
 __all__ = ["CodeScanner", "CodeSnapshot"]
 
@@ -24,6 +31,15 @@ __all__ = ["CodeScanner", "CodeSnapshot"]
 MAX_CHARS_PER_FILE: int = 10_000
 #: Global ceiling – protects overall prompt budget
 MAX_TOTAL_CHARS: int = 60_000
+#: Upper bound on concurrent file reads (I/O bound – the GIL is released)
+MAX_READ_WORKERS: int = 32
+#: Marker appended to files cut at ``MAX_CHARS_PER_FILE``
+_TRUNCATED: str = "\n# …truncated…\n"
+
+#: ``(posix path, st_mtime_ns, st_size)`` of every file in a snapshot
+_Fingerprint = Tuple[Tuple[str, int, int], ...]
+#: Last snapshot per scanned root, reused while its fingerprint is unchanged
+_SNAPSHOT_CACHE: Dict[Path, Tuple[_Fingerprint, "CodeSnapshot"]] = {}
 
 
 # ───────────────────────────────── helpers ───────────────────────────────── #
@@ -33,13 +49,22 @@ class GitIgnoreFilter:
 
     def __init__(self, root: Path) -> None:
         gi = root / ".gitignore"
-        patterns: Sequence[str] = gi.read_text().splitlines() if gi.exists() else []
-        self._spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+        patterns: Sequence[str] = tuple(gi.read_text().splitlines()) if gi.exists() else ()
+        self._spec = GitIgnoreSpec.from_lines(patterns)
 
     def match(self, rel_path: Path) -> bool:
         """Check whether *rel_path* (POSIX style) is ignored."""
         return self._spec.match_file(rel_path.as_posix())
 
+    def match_dir(self, rel_dir: Path) -> bool:
+        """Check whether the directory *rel_dir* is ignored (dir‑only patterns too)."""
+        return self._spec.match_file(rel_dir.as_posix() + "/")
+
+    def match_files(self, rel_paths: Iterable[str]) -> Set[str]:
+        """Return the subset of *rel_paths* (POSIX strings) that is ignored."""
+        # pathspec yields its inputs back (typed StrPath); ours are all str
+        return set(map(str, self._spec.match_files(rel_paths)))
+
 
 class CodeSnapshot(str):
     """
@@ -50,28 +75,53 @@ class CodeSnapshot(str):
 
     @staticmethod
     def from_paths(root: Path, files: Iterable[Path]) -> "CodeSnapshot":
-        tree: List[str] = ["# Project layout\n"]
-        for f in sorted(files):
-            tree.append(f"* {f.as_posix()}")
-        md = "\n".join(tree) + "\n\n# Files\n"
-
-        total = len(md)
-        body: List[str] = [md]
-
-        for f in files:
-            code = f.read_text(encoding="utf‑8", errors="replace")
-            if len(code) > MAX_CHARS_PER_FILE:
-                code = textwrap.shorten(code, MAX_CHARS_PER_FILE, placeholder="\n# …truncated…\n")
-
-            snippet = f"```python {f.as_posix()}\n{code}\n```\n\n"
-            if total + len(snippet) > MAX_TOTAL_CHARS:
-                body.append("*Further files omitted to fit context*\n")
-                break
-
-            body.append(snippet)
-            total += len(snippet)
-
-        return CodeSnapshot("".join(body))
+        """
+        Build the snapshot for *files* (relative to *root*).
+
+        *files* is materialised and sorted once, so generators are safe to
+        pass, and each POSIX path string is computed a single time and reused
+        for both the layout list and the fenced bodies.
+        Files are read concurrently on a thread pool to overlap storage
+        latency; results are consumed in order so the output is deterministic.
+        """
+        entries = [(f, f.as_posix()) for f in files]
+        entries.sort(key=lambda e: e[1])
+
+        # tree listing and file bodies go straight into one buffer
+        buf = io.StringIO()
+        buf.write("# Project layout\n\n")
+        for _, posix in entries:
+            buf.write(f"* {posix}\n")
+        buf.write("\n# Files\n")
+
+        def _read(f: Path) -> Tuple[str, bool]:
+            # map the file and decode only the first MAX_CHARS_PER_FILE bytes
+            with (root / f).open("rb") as fh:
+                size = os.fstat(fh.fileno()).st_size
+                if size == 0:                    # empty files cannot be mapped
+                    return "", False
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    code = mm[:MAX_CHARS_PER_FILE].decode("utf-8", errors="replace")
+            return code, size > MAX_CHARS_PER_FILE
+
+        pool = ThreadPoolExecutor(max_workers=max(1, min(MAX_READ_WORKERS, len(entries))))
+        try:
+            for (_, posix), (code, truncated) in zip(entries, pool.map(_read, (f for f, _ in entries))):
+                if truncated:
+                    # plain slice: keeps indentation intact (unlike textwrap)
+                    code = code[: MAX_CHARS_PER_FILE - len(_TRUNCATED)] + _TRUNCATED
+
+                snippet = f"```python {posix}\n{code}\n```\n\n"
+                if buf.tell() + len(snippet) > MAX_TOTAL_CHARS:
+                    buf.write("*Further files omitted to fit context*\n")
+                    break
+
+                buf.write(snippet)
+        finally:
+            # reads still queued once the global cap is hit are cancelled
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        return CodeSnapshot(buf.getvalue())
 
 
 class CodeScanner:
@@ -83,11 +133,51 @@ class CodeScanner:
 
     # public API ------------------------------------------------------------ #
     def scan(self) -> CodeSnapshot:
-        print("Analysing codebase at : ", self._root)
-        py_files: List[Path] = []
-        for path in self._root.rglob("*.py"):
-            print("Reading file : ", path)
-            rel = path.relative_to(self._root)
-            if not self._filter.match(rel):
-                py_files.append(rel)
-        return CodeSnapshot.from_paths(self._root, py_files)
\ No newline at end of file
+        candidates = [(rel, rel.as_posix(), st) for rel, st in self._walk()]
+        ignored = self._filter.match_files(posix for _, posix, _ in candidates)
+        kept = [c for c in candidates if c[1] not in ignored]
+        py_files: List[Path] = [rel for rel, _, _ in kept]
+
+        # stat results come from the walk: comparing them is far cheaper than
+        # re-reading and re-decoding every file
+        fingerprint: _Fingerprint = tuple(sorted(
+            (posix, st.st_mtime_ns, st.st_size) for _, posix, st in kept
+        ))
+        cached = _SNAPSHOT_CACHE.get(self._root)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        snapshot = CodeSnapshot.from_paths(self._root, py_files)
+        _SNAPSHOT_CACHE[self._root] = (fingerprint, snapshot)
+        return snapshot
+
+    # internals ------------------------------------------------------------- #
+    def _walk(self) -> Iterator[Tuple[Path, os.stat_result]]:
+        """
+        Yield ``(path, stat)`` for every ``*.py`` file below the root, with
+        *path* relative to it.  Files that vanish mid‑walk are skipped.
+
+        Ignored directories are pruned *before* descending, so subtrees such
+        as ``.venv/`` or ``node_modules/`` cost one ``scandir`` entry instead
+        of a full walk.  ``DirEntry`` caches its stat result, and symlinked
+        directories are not followed.
+        """
+        stack: List[Tuple[Path, Path]] = [(self._root, Path())]
+        while stack:
+            abs_dir, rel_dir = stack.pop()
+            try:
+                it = os.scandir(abs_dir)
+            except OSError:                      # vanished / unreadable
+                continue
+            with it:
+                for entry in it:
+                    rel = rel_dir / entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != ".git" and not self._filter.match_dir(rel):
+                            stack.append((Path(entry.path), rel))
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        try:
+                            st = entry.stat()
+                        except OSError:          # deleted since scandir
+                            continue
+                        yield rel, st